@@ -1,23 +1,70 @@
 import os
-import re
+import unicodedata
+from urllib.parse import quote
 
 import pandas as pd
-from datetime import datetime
-from flask import Flask, render_template, request, send_file, session
+from cachelib import FileSystemCache
+from flask import Flask, Response, render_template, request, session
+from flask_session import Session
 
 from core import (
     get_flight,
     make_ics_from_selected_df_index,
     make_ics_from_manual_data,
     get_timezones_with_offsets,
+    parse_manual_datetime,
 )
 
 app = Flask(__name__)
 
 
-secret_key = os.urandom(24)
+# Use a stable key from the environment so it is shared across workers
+secret_key = os.environ.get("SECRET_KEY") or os.urandom(24)
 app.secret_key = secret_key
 
+# Keep flight data server-side; the cookie only carries the session id
+app.config["SESSION_TYPE"] = "cachelib"
+session_dir = os.environ.get("SESSION_FILE_DIR") or os.path.join(
+    app.root_path, "flask_session"
+)
+app.config["SESSION_CACHELIB"] = FileSystemCache(cache_dir=session_dir)
+Session(app)
+
+# Editable flight fields posted by the select and manual entry forms
+_FLIGHT_FIELDS = (
+    "flight_number",
+    "airline_name",
+    "origin_airport",
+    "origin_airport_code",
+    "destination_airport",
+    "destination_airport_code",
+    "scheduled_departure",
+    "scheduled_arrival",
+    "origin_timezone",
+    "destination_timezone",
+)
+
+
+def _ics_response(ics_data: bytes, flight: str) -> Response:
+    download_name = f"{flight}.ics"
+    # Same Content-Disposition handling as send_file, including non-ASCII names
+    if download_name.isascii():
+        names = {"filename": download_name}
+    else:
+        simple = unicodedata.normalize("NFKD", download_name)
+        simple = simple.encode("ascii", "ignore").decode("ascii")
+        # safe = RFC 5987 attr-char
+        quoted = quote(download_name, safe="!#$&+-.^_`|~")
+        names = {"filename": simple, "filename*": f"UTF-8''{quoted}"}
+    response = Response(ics_data, mimetype="text/calendar")
+    response.headers.set("Content-Disposition", "attachment", **names)
+    return response
+
+
+def _valid_code(code: str) -> bool:
+    """Check for a 3-letter uppercase IATA airport code."""
+    return len(code) == 3 and code.isascii() and code.isalpha() and code.isupper()
+
 
 @app.route("/")
 def index():
@@ -30,11 +77,10 @@ def create_ical():
         flight = request.form.get("flight_number")
         date = request.form.get("flight_date")
         df = get_flight(flight, date)
-        # Store the DataFrame as JSON in the session
-        session["df"] = df.to_json(orient="split")
-        return render_template(
-            "select_flight.html", flights=df.to_dict(orient="records")
-        )
+        flights = df.to_dict(orient="records")
+        # Store the flight records in the session
+        session["flights"] = flights
+        return render_template("select_flight.html", flights=flights)
     except Exception as e:
         error_message = str(e)
         return render_template("index.html", error=error_message)
@@ -42,26 +88,15 @@ def create_ical():
 
 @app.route("/create_event/<int:index>", methods=["POST"])
 def create_ical_from_selected(index):
-    # Retrieve the DataFrame from the session and reconstruct it
-    df_json = session.get("df")
-    if df_json is None:
+    # Retrieve the flight records from the session and rebuild the DataFrame
+    flights = session.get("flights")
+    if flights is None:
         return "No flight data found", 400
 
-    df = pd.read_json(df_json, orient="split")
+    df = pd.DataFrame(flights)
 
     # Check if any custom fields were provided (user edited the flight)
-    custom_fields = {
-        "flight_number": request.form.get("flight_number"),
-        "airline_name": request.form.get("airline_name"),
-        "origin_airport": request.form.get("origin_airport"),
-        "origin_airport_code": request.form.get("origin_airport_code"),
-        "destination_airport": request.form.get("destination_airport"),
-        "destination_airport_code": request.form.get("destination_airport_code"),
-        "scheduled_departure": request.form.get("scheduled_departure"),
-        "scheduled_arrival": request.form.get("scheduled_arrival"),
-        "origin_timezone": request.form.get("origin_timezone"),
-        "destination_timezone": request.form.get("destination_timezone"),
-    }
+    custom_fields = {field: request.form.get(field) for field in _FLIGHT_FIELDS}
 
     # Update the DataFrame with custom fields if they were provided
     for field, value in custom_fields.items():
@@ -69,9 +104,9 @@ def create_ical_from_selected(index):
             df.at[index, field] = value
 
     ics_data = make_ics_from_selected_df_index(df, index)
-    flight = df.iloc[index]["flight_number"]
+    flight = df.at[index, "flight_number"]
 
-    return send_file(ics_data, as_attachment=True, download_name=f"{flight}.ics")
+    return _ics_response(ics_data, flight)
 
 
 @app.route("/manual_entry")
@@ -84,40 +119,19 @@ def manual_entry():
 def create_manual_event():
     try:
         # Get all form data
-        flight_data = {
-            "flight_number": request.form.get("flight_number"),
-            "airline_name": request.form.get("airline_name"),
-            "origin_airport": request.form.get("origin_airport"),
-            "origin_airport_code": request.form.get("origin_airport_code"),
-            "destination_airport": request.form.get("destination_airport"),
-            "destination_airport_code": request.form.get("destination_airport_code"),
-            "scheduled_departure": request.form.get("scheduled_departure"),
-            "scheduled_arrival": request.form.get("scheduled_arrival"),
-            "origin_timezone": request.form.get("origin_timezone"),
-            "destination_timezone": request.form.get("destination_timezone"),
-        }
+        flight_data = {field: request.form.get(field) for field in _FLIGHT_FIELDS}
 
         # Validate required fields
-        required_fields = [
-            "flight_number",
-            "airline_name",
-            "origin_airport",
-            "origin_airport_code",
-            "destination_airport",
-            "destination_airport_code",
-            "scheduled_departure",
-            "scheduled_arrival",
-            "origin_timezone",
-            "destination_timezone",
-        ]
-        for field in required_fields:
-            if not flight_data.get(field):
-                raise ValueError(f"Missing required field: {field}")
+        missing = next(
+            (field for field in _FLIGHT_FIELDS if not flight_data[field]), None
+        )
+        if missing:
+            raise ValueError(f"Missing required field: {missing}")
 
         # Validate airport codes (should be 3 uppercase letters)
-        if not re.match(r"^[A-Z]{3}$", flight_data["origin_airport_code"]):
+        if not _valid_code(flight_data["origin_airport_code"]):
             raise ValueError("Origin airport code must be 3 uppercase letters")
-        if not re.match(r"^[A-Z]{3}$", flight_data["destination_airport_code"]):
+        if not _valid_code(flight_data["destination_airport_code"]):
             raise ValueError("Destination airport code must be 3 uppercase letters")
 
         # Validate datetime format (datetime-local format: YYYY-MM-DDTHH:MM or YYYY-MM-DD HH:MM)
@@ -133,8 +147,8 @@ def create_manual_event():
                     "scheduled_arrival"
                 ].replace("T", " ")
 
-            datetime.strptime(flight_data["scheduled_departure"], "%Y-%m-%d %H:%M")
-            datetime.strptime(flight_data["scheduled_arrival"], "%Y-%m-%d %H:%M")
+            parse_manual_datetime(flight_data["scheduled_departure"])
+            parse_manual_datetime(flight_data["scheduled_arrival"])
         except ValueError:
             raise ValueError("Invalid datetime format. Use: yyyy-mm-dd hh:mm")
 
@@ -142,7 +156,7 @@ def create_manual_event():
         ics_data = make_ics_from_manual_data(flight_data)
         flight = flight_data["flight_number"]
 
-        return send_file(ics_data, as_attachment=True, download_name=f"{flight}.ics")
+        return _ics_response(ics_data, flight)
     except Exception as e:
         error_message = str(e)
         timezones = get_timezones_with_offsets()
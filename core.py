@@ -1,23 +1,121 @@
-import io
 import re
 from datetime import datetime, timedelta, timezone as dt_timezone
+from functools import lru_cache
 
 import icalendar
 import pandas as pd
+from icalendar.parser import escape_char, foldline
 from pyflightdata import FlightData
 from pytz import timezone, all_timezones, utc
+from pytz.tzinfo import StaticTzInfo
 
 f = FlightData()
 
+_ICS_TEMPLATE = (
+    "BEGIN:VCALENDAR\r\n"
+    "VERSION:2.0\r\n"
+    "PRODID:-//eluceo/ical//2.0/EN\r\n"
+    "CALSCALE:GREGORIAN\r\n"
+    "METHOD:REQUEST\r\n"
+    "BEGIN:VEVENT\r\n"
+    "{summary}\r\n"
+    "{dtstart}\r\n"
+    "{dtend}\r\n"
+    "DTSTAMP:{dtstamp}Z\r\n"
+    "{description}\r\n"
+    "{location}\r\n"
+    "STATUS:CONFIRMED\r\n"
+    "END:VEVENT\r\n"
+    "END:VCALENDAR\r\n"
+)
+
+_FLIGHT_CLEAN_RE = re.compile(r"[^A-Za-z0-9]")
+_FLIGHT_SPLIT_RE = re.compile(r"([A-Z]+)([0-9]+)")
+
+# Column order of the rows returned by parse_flight_info
+_FLIGHT_COLS = (
+    "flight_number",
+    "scheduled_departure",
+    "scheduled_arrival",
+    "airline_name",
+    "origin_airport",
+    "destination_airport",
+    "origin_timezone",
+    "destination_timezone",
+    "origin_airport_code",
+    "destination_airport_code",
+)
+
+# Map common airline codes to names
+_AIRLINE_MAP = {
+    "BA": "British Airways",
+    "AA": "American Airlines",
+    "UA": "United Airlines",
+    "LH": "Lufthansa",
+    "AF": "Air France",
+    "KL": "KLM",
+    "IB": "Iberia",
+    "AS": "Alaska Airlines",
+    "DL": "Delta Air Lines",
+    "SW": "Southwest Airlines",
+    "EK": "Emirates",
+    "QF": "Qantas",
+    "SQ": "Singapore Airlines",
+    "NH": "All Nippon Airways",
+    "CX": "Cathay Pacific",
+    "AC": "Air Canada",
+    "OS": "Austrian Airlines",
+    "AZ": "Alitalia",
+    "BE": "Brussels Airlines",
+    "CA": "Air China",
+    "CI": "China Airlines",
+    "CM": "China Eastern Airlines",
+    "CZ": "China Southern Airlines",
+    "EY": "Etihad Airways",
+    "FI": "Icelandair",
+    "GA": "Garuda Indonesia",
+    "G3": "GOL",
+    "HA": "Hawaiian Airlines",
+    "JL": "Japan Airlines",
+    "LA": "LATAM Airlines",
+    "LX": "Swiss International Air Lines",
+    "MH": "Malaysia Airlines",
+    "NZ": "Air New Zealand",
+    "PR": "Philippine Airlines",
+    "QR": "Qatar Airways",
+    "RJ": "Royal Jordanian",
+    "SK": "SAS",
+    "SN": "Brussels Airlines",
+    "TG": "Thai Airways",
+    "TK": "Turkish Airlines",
+    "TP": "TAP Air Portugal",
+    "VN": "Vietnam Airlines",
+    "VX": "Virgin America",
+    "WN": "Southwest Airlines",
+}
+
+
+@lru_cache(maxsize=1024)
+def _tz(name: str):
+    return timezone(name)
+
 
 def get_timezones_with_offsets():
     """Get all timezones with their UTC offsets."""
-    timezones_dict = {}
+    global _tz_snapshot
     now = datetime.now(utc)
+    # Offsets only change on DST transitions, so refresh the snapshot lazily
+    if now - _tz_snapshot[0] >= _TZ_REFRESH_INTERVAL:
+        _tz_snapshot = (now, _compute_timezones_with_offsets(now))
+    return _tz_snapshot[1]
+
+
+def _compute_timezones_with_offsets(now: datetime) -> list:
+    timezones = []
 
     for tz_name in all_timezones:
         try:
-            tz = timezone(tz_name)
+            tz = _tz(tz_name)
             offset = tz.utcoffset(now)
             if offset is not None:
                 hours, remainder = divmod(int(offset.total_seconds()), 3600)
@@ -26,17 +124,21 @@ def get_timezones_with_offsets():
                     offset_str = f"UTC{hours:+03d}:{minutes:02d}"
                 else:
                     offset_str = f"UTC{hours:+03d}:00"
-                timezones_dict[tz_name] = f"{tz_name} ({offset_str})"
+                timezones.append((offset, tz_name, f"{tz_name} ({offset_str})"))
         except Exception:
             continue
 
     # Sort by offset, then by name
-    sorted_timezones = sorted(
-        timezones_dict.items(), key=lambda x: (timezone(x[0]).utcoffset(now), x[0])
-    )
-    return sorted_timezones
+    timezones.sort()
+    return [(tz_name, display) for _, tz_name, display in timezones]
 
 
+_TZ_REFRESH_INTERVAL = timedelta(minutes=30)
+
+# Built at import so requests only read the current snapshot
+_tz_now = datetime.now(utc)
+_tz_snapshot = (_tz_now, _compute_timezones_with_offsets(_tz_now))
+
 # test_config
 # flight_number = "SQ327"
 # date = "2024-10-23"
@@ -44,9 +146,7 @@ def get_timezones_with_offsets():
 
 def make_ics_from_selected_df_index(df: pd.DataFrame, index: int) -> bytes:
     data = df.iloc[index].to_dict()
-    ical_event = make_ical_event(data)
-    ics = save_ical_event(ical_event)
-    return ics
+    return make_ical_event(data)
 
 
 def get_flight(flight_number: str, date: str) -> pd.DataFrame:
@@ -58,7 +158,9 @@ def get_flight(flight_number: str, date: str) -> pd.DataFrame:
     if isinstance(flight_info, dict):
         flight_info = list(flight_info.values())
 
-    if not flight_info:
+    # Fall back to the flight history and move it to the requested date
+    is_guess = not flight_info
+    if is_guess:
         try:
             flight_info = find_flight_no_date(flight_number)
         except Exception:
@@ -66,168 +168,140 @@ def get_flight(flight_number: str, date: str) -> pd.DataFrame:
                 f"No flight information found for flight number {flight_number}."
             )
         flight_info = drop_ununique_flights(flight_info)
-        df = pd.DataFrame(
-            [parse_flight_info(flight_info, i) for i in range(len(flight_info))]
-        )
-        df["is_guess"] = True
-        for i in range(len(df)):
-            df.loc[i] = move_flight_date(df.loc[i], date)
-        df = update_df_timezones(df)
-        df = parse_nice_datetime(df)
-        return df
-    else:
-        if len(flight_info) > 1:
-            df = pd.DataFrame(
-                [parse_flight_info(flight_info, i) for i in range(len(flight_info))]
-            )
-            df["is_guess"] = False
-            df = update_df_timezones(df)
-            df = parse_nice_datetime(df)
-            return df
-        else:
-            df = pd.DataFrame([parse_flight_info(flight_info, 0)])
-            df["is_guess"] = False
-            df = update_df_timezones(df)
-            df = parse_nice_datetime(df)
-            return df
+
+    df = _flights_to_df(flight_info)
+    df["is_guess"] = is_guess
+    if is_guess:
+        df = move_df_flight_dates(df, date)
+    df = update_df_timezones(df)
+    df = parse_nice_datetime(df)
+    return df
+
+
+def _flights_to_df(flight_info: list) -> pd.DataFrame:
+    # Parsed serially: the work is pure-Python dict access that holds the GIL,
+    # so a thread pool only adds dispatch overhead, even for long histories
+    rows = [parse_flight_info(flight_info, i) for i in range(len(flight_info))]
+    return pd.DataFrame.from_records(rows, columns=_FLIGHT_COLS)
 
 
 def update_df_timezones(df: pd.DataFrame) -> pd.DataFrame:
-    for i in range(len(df)):
-        origin_tz = timezone(df.loc[i]["origin_timezone"])
-        destination_tz = timezone(df.loc[i]["destination_timezone"])
-
-        # Convert scheduled departure and arrival from UTC time to origin and destination timezones
-        utc_tz = timezone("UTC")
-        scheduled_departure_utc = utc_tz.localize(
-            datetime.strptime(df.loc[i]["scheduled_departure"], "%Y%m%d %H%M")
+    # Convert scheduled departure and arrival from UTC time to origin and destination timezones
+    scheduled_departure_utc = pd.to_datetime(
+        df["scheduled_departure"], format="%Y%m%d %H%M", utc=True
+    )
+    scheduled_arrival_utc = pd.to_datetime(
+        df["scheduled_arrival"], format="%Y%m%d %H%M", utc=True
+    )
+
+    # Keep missing zones as their own group so _tz rejects them
+    for tz_name, idx in df.groupby("origin_timezone", dropna=False).groups.items():
+        df.loc[idx, "scheduled_departure"] = (
+            scheduled_departure_utc.loc[idx]
+            .dt.tz_convert(_tz(tz_name))
+            .dt.strftime("%Y%m%d %H%M")
         )
-        scheduled_arrival_utc = utc_tz.localize(
-            datetime.strptime(df.loc[i]["scheduled_arrival"], "%Y%m%d %H%M")
+    for tz_name, idx in df.groupby("destination_timezone", dropna=False).groups.items():
+        df.loc[idx, "scheduled_arrival"] = (
+            scheduled_arrival_utc.loc[idx]
+            .dt.tz_convert(_tz(tz_name))
+            .dt.strftime("%Y%m%d %H%M")
         )
-
-        df.at[i, "scheduled_departure"] = scheduled_departure_utc.astimezone(
-            origin_tz
-        ).strftime("%Y%m%d %H%M")
-        df.at[i, "scheduled_arrival"] = scheduled_arrival_utc.astimezone(
-            destination_tz
-        ).strftime("%Y%m%d %H%M")
     return df
 
 
-def parse_flight_info(flight_info: dict, chosen_flight_index: int) -> dict:
-    n = chosen_flight_index
-    flight_number = flight_info[n]["identification"]["number"]["default"]
+def parse_flight_info(flight_info: dict, chosen_flight_index: int) -> tuple:
+    flight = flight_info[chosen_flight_index]
+    scheduled = flight["time"]["scheduled"]
+    origin = flight["airport"]["origin"]
+    destination = flight["airport"]["destination"]
+
+    flight_number = flight["identification"]["number"]["default"]
     scheduled_departure = (
-        flight_info[n]["time"]["scheduled"]["departure_date"]
-        + " "
-        + flight_info[n]["time"]["scheduled"]["departure_time"]
-    )
-    scheduled_arrival = (
-        flight_info[n]["time"]["scheduled"]["arrival_date"]
-        + " "
-        + flight_info[n]["time"]["scheduled"]["arrival_time"]
+        scheduled["departure_date"] + " " + scheduled["departure_time"]
     )
+    scheduled_arrival = scheduled["arrival_date"] + " " + scheduled["arrival_time"]
     # Handle cases where airline is 'None' string or missing
-    airline = flight_info[n].get("airline")
+    airline = flight.get("airline")
     if isinstance(airline, dict) and airline.get("name"):
         airline_name = airline["name"]
     else:
-        # Try to extract airline code from flight number (e.g., "BA" from "BA929")
-        match = re.match(r"([A-Z]+)", flight_number)
-        if match:
-            airline_code = match.group(1)
-            # Map common airline codes to names
-            airline_map = {
-                "BA": "British Airways",
-                "AA": "American Airlines",
-                "UA": "United Airlines",
-                "LH": "Lufthansa",
-                "AF": "Air France",
-                "KL": "KLM",
-                "IB": "Iberia",
-                "AS": "Alaska Airlines",
-                "DL": "Delta Air Lines",
-                "SW": "Southwest Airlines",
-                "EK": "Emirates",
-                "QF": "Qantas",
-                "SQ": "Singapore Airlines",
-                "NH": "All Nippon Airways",
-                "CX": "Cathay Pacific",
-                "AC": "Air Canada",
-                "OS": "Austrian Airlines",
-                "AZ": "Alitalia",
-                "BE": "Brussels Airlines",
-                "CA": "Air China",
-                "CI": "China Airlines",
-                "CM": "China Eastern Airlines",
-                "CZ": "China Southern Airlines",
-                "EY": "Etihad Airways",
-                "FI": "Icelandair",
-                "GA": "Garuda Indonesia",
-                "G3": "GOL",
-                "HA": "Hawaiian Airlines",
-                "JL": "Japan Airlines",
-                "LA": "LATAM Airlines",
-                "LX": "Swiss International Air Lines",
-                "MH": "Malaysia Airlines",
-                "NZ": "Air New Zealand",
-                "PR": "Philippine Airlines",
-                "QR": "Qatar Airways",
-                "RJ": "Royal Jordanian",
-                "SK": "SAS",
-                "SN": "Brussels Airlines",
-                "TG": "Thai Airways",
-                "TK": "Turkish Airlines",
-                "TP": "TAP Air Portugal",
-                "VN": "Vietnam Airlines",
-                "VX": "Virgin America",
-                "WN": "Southwest Airlines",
-            }
-            airline_name = airline_map.get(airline_code, f"Airline ({airline_code})")
-        else:
-            airline_name = "Unknown Airline"
-
-    origin_airport = flight_info[n]["airport"]["origin"]["name"]
-    destination_airport = flight_info[n]["airport"]["destination"]["name"]
-    origin_timezone = flight_info[n]["airport"]["origin"]["timezone"]["name"]
-    destination_timezone = flight_info[n]["airport"]["destination"]["timezone"]["name"]
-    origin_airport_code = flight_info[n]["airport"]["origin"]["code"]["iata"]
-    destination_airport_code = flight_info[n]["airport"]["destination"]["code"]["iata"]
-    return {
-        "flight_number": flight_number,
-        "scheduled_departure": scheduled_departure,
-        "scheduled_arrival": scheduled_arrival,
-        "airline_name": airline_name,
-        "origin_airport": origin_airport,
-        "destination_airport": destination_airport,
-        "origin_timezone": origin_timezone,
-        "destination_timezone": destination_timezone,
-        "origin_airport_code": origin_airport_code,
-        "destination_airport_code": destination_airport_code,
-    }
+        airline_name = _airline_name_from_flight_number(flight_number)
+
+    origin_airport = origin["name"]
+    destination_airport = destination["name"]
+    origin_timezone = origin["timezone"]["name"]
+    destination_timezone = destination["timezone"]["name"]
+    origin_airport_code = origin["code"]["iata"]
+    destination_airport_code = destination["code"]["iata"]
+    return (
+        flight_number,
+        scheduled_departure,
+        scheduled_arrival,
+        airline_name,
+        origin_airport,
+        destination_airport,
+        origin_timezone,
+        destination_timezone,
+        origin_airport_code,
+        destination_airport_code,
+    )
+
+
+@lru_cache(maxsize=256)
+def _airline_name_from_flight_number(flight_number: str) -> str:
+    # Try to extract airline code from flight number (e.g., "BA" from "BA929")
+    end = 0
+    while end < len(flight_number) and "A" <= flight_number[end] <= "Z":
+        end += 1
+    if not end:
+        return "Unknown Airline"
+    airline_code = flight_number[:end]
+    return _AIRLINE_MAP.get(airline_code, f"Airline ({airline_code})")
 
 
 def parse_date(date: str) -> str:
     return datetime.strptime(date, "%Y-%m-%d").strftime("%Y%m%d")
 
 
+def parse_manual_datetime(value: str) -> datetime:
+    # Slice the zero-padded "YYYY-MM-DD HH:MM" form directly, anything else
+    # (e.g. "2024-1-3 1:30") goes through strptime
+    digits = value[0:4] + value[5:7] + value[8:10] + value[11:13] + value[14:16]
+    if (
+        len(value) == 16
+        and value[4] == value[7] == "-"
+        and value[10] == " "
+        and value[13] == ":"
+        and digits.isascii()
+        and digits.isdigit()
+    ):
+        return datetime(
+            int(value[0:4]),
+            int(value[5:7]),
+            int(value[8:10]),
+            int(value[11:13]),
+            int(value[14:16]),
+        )
+    return datetime.strptime(value, "%Y-%m-%d %H:%M")
+
+
 def parse_nice_datetime(df: pd.DataFrame) -> pd.DataFrame:
-    df["nice_departure_date"] = df["scheduled_departure"].apply(
-        lambda x: datetime.strptime(x, "%Y%m%d %H%M").strftime("%Y-%m-%d %H:%M")
-    )
-    df["nice_arrival_date"] = df["scheduled_arrival"].apply(
-        lambda x: datetime.strptime(x, "%Y%m%d %H%M").strftime("%Y-%m-%d %H:%M")
-    )
+    df["nice_departure_date"] = pd.to_datetime(
+        df["scheduled_departure"], format="%Y%m%d %H%M"
+    ).dt.strftime("%Y-%m-%d %H:%M")
+    df["nice_arrival_date"] = pd.to_datetime(
+        df["scheduled_arrival"], format="%Y%m%d %H%M"
+    ).dt.strftime("%Y-%m-%d %H:%M")
     return df
 
 
 def parse_flight_number(flight_number: str) -> str:
     # Remove any non-alphanumeric characters and convert to uppercase
-    cleaned_flight_number = re.sub(r"[^A-Za-z0-9]", "", flight_number).upper()
+    cleaned_flight_number = _FLIGHT_CLEAN_RE.sub("", flight_number).upper()
 
     # Match the cleaned flight number
-    match = re.match(r"([A-Z]+)([0-9]+)", cleaned_flight_number)
+    match = _FLIGHT_SPLIT_RE.match(cleaned_flight_number)
     if match:
         letters, numbers = match.groups()
         return letters + numbers.lstrip("0")
@@ -250,127 +324,129 @@ def find_flight_no_date(flight_number: str):
     return flight_info
 
 
+def _parse_compact(value: str) -> datetime:
+    # Slice the fixed-width "YYYYMMDD HHMM" form directly, anything else
+    # goes through strptime
+    digits = value[0:8] + value[9:13]
+    if len(value) == 13 and value[8] == " " and digits.isascii() and digits.isdigit():
+        return datetime(
+            int(value[0:4]),
+            int(value[4:6]),
+            int(value[6:8]),
+            int(value[9:11]),
+            int(value[11:13]),
+        )
+    return datetime.strptime(value, "%Y%m%d %H%M")
+
+
+def _fmt_compact(dt: datetime) -> str:
+    return f"{dt.year:04d}{dt.month:02d}{dt.day:02d} {dt.hour:02d}{dt.minute:02d}"
+
+
+def _localize(tz, dt: datetime) -> datetime:
+    # Fixed-offset zones (UTC, Etc/GMT*) have no DST, so attach them directly
+    if tz is utc or isinstance(tz, StaticTzInfo):
+        return dt.replace(tzinfo=tz)
+    return tz.localize(dt)
+
+
 def drop_ununique_flights(flight_info) -> list:
     # only keeps flights which have a different scheduled departure time (ignoring date)
     unique_departure_times = set()
-    unique_flights = []
     # Handle both list and dict returns from the API
-    flights_list = (
-        flight_info if isinstance(flight_info, list) else list(flight_info.values())
-    )
-    for flight in flights_list:
-        departure_time = flight["time"]["scheduled"]["departure_time"]
-        if departure_time not in unique_departure_times:
-            unique_departure_times.add(departure_time)
-            unique_flights.append(flight)
-    return unique_flights
+    flights = flight_info.values() if isinstance(flight_info, dict) else flight_info
+    return [
+        flight
+        for flight in flights
+        if not (
+            (departure_time := flight["time"]["scheduled"]["departure_time"])
+            in unique_departure_times
+            or unique_departure_times.add(departure_time)
+        )
+    ]
 
 
 def move_flight_date(flight_info: dict, date: str):
-    scheduled_departure = datetime.strptime(
-        flight_info["scheduled_departure"], "%Y%m%d %H%M"
-    )
-    scheduled_arrival = datetime.strptime(
-        flight_info["scheduled_arrival"], "%Y%m%d %H%M"
-    )
+    scheduled_departure = _parse_compact(flight_info["scheduled_departure"])
+    scheduled_arrival = _parse_compact(flight_info["scheduled_arrival"])
 
-    # Calculate the day difference
+    # Shift departure and arrival by the day difference to the given date
     date = datetime.strptime(date, "%Y%m%d").date()
-    day_difference = (date - scheduled_departure.date()).days
-
-    # Adjust the scheduled departure and arrival dates
-    if day_difference != 0:
-        scheduled_departure = scheduled_departure + timedelta(days=day_difference)
-        scheduled_arrival = scheduled_arrival + timedelta(days=day_difference)
-    else:
-        scheduled_departure = datetime.combine(date, scheduled_departure.time())
-        scheduled_arrival = datetime.combine(date, scheduled_arrival.time())
-
-    flight_info["scheduled_departure"] = scheduled_departure.strftime("%Y%m%d %H%M")
-    flight_info["scheduled_arrival"] = scheduled_arrival.strftime("%Y%m%d %H%M")
+    day_difference = timedelta(days=(date - scheduled_departure.date()).days)
 
+    flight_info["scheduled_departure"] = _fmt_compact(
+        scheduled_departure + day_difference
+    )
+    flight_info["scheduled_arrival"] = _fmt_compact(scheduled_arrival + day_difference)
     return flight_info
 
 
-def make_ical_event(data: dict):
-    cal = icalendar.Calendar()
-    cal.add("prodid", "-//eluceo/ical//2.0/EN")
-    cal.add("version", "2.0")
-    cal.add("calscale", "GREGORIAN")
-    cal.add("method", "REQUEST")
-
-    event = icalendar.Event()
-    event.add(
-        "summary",
-        f"🛫 {data['airline_name']} {data['origin_airport_code']} ➡️ "
-        f"{data['destination_airport_code']} {data['flight_number']}",
+def move_df_flight_dates(df: pd.DataFrame, date: str) -> pd.DataFrame:
+    scheduled_departure = pd.to_datetime(
+        df["scheduled_departure"], format="%Y%m%d %H%M"
     )
-    origin_tz = timezone(data["origin_timezone"])
-    destination_tz = timezone(data["destination_timezone"])
+    scheduled_arrival = pd.to_datetime(df["scheduled_arrival"], format="%Y%m%d %H%M")
 
-    dtstart = origin_tz.localize(
-        datetime.strptime(data["scheduled_departure"], "%Y%m%d %H%M")
+    # Shift departure and arrival by the day difference to the given date
+    day_difference = (
+        pd.to_datetime(date, format="%Y%m%d") - scheduled_departure.dt.normalize()
     )
-    dtend = destination_tz.localize(
-        datetime.strptime(data["scheduled_arrival"], "%Y%m%d %H%M")
+    df["scheduled_departure"] = (scheduled_departure + day_difference).dt.strftime(
+        "%Y%m%d %H%M"
     )
-
-    event.add("dtstart", dtstart)
-    event.add("dtend", dtend)
-    event.add("location", f"{data['origin_airport']}")
-    event.add(
-        "description",
-        f"{data['airline_name']} flight {data['flight_number']} / Departs {data['origin_airport']}, {data['origin_airport_code']}",
+    df["scheduled_arrival"] = (scheduled_arrival + day_difference).dt.strftime(
+        "%Y%m%d %H%M"
     )
-    event.add("dtstamp", datetime.now(dt_timezone.utc))
-
-    event.add("status", "CONFIRMED")
+    return df
 
-    cal.add_component(event)
-    return cal.to_ical()
 
+def make_ical_event(data: dict):
+    origin_tz = _tz(data["origin_timezone"])
+    destination_tz = _tz(data["destination_timezone"])
 
-def save_ical_event(ical_event: bytes):
-    ical_bytes = io.BytesIO(ical_event)
-    return ical_bytes
+    dtstart = _localize(origin_tz, _parse_compact(data["scheduled_departure"]))
+    dtend = _localize(destination_tz, _parse_compact(data["scheduled_arrival"]))
+    return _build_ics(data, dtstart, dtend)
 
 
-def make_ics_from_manual_data(data: dict):
+def make_ics_from_manual_data(data: dict) -> bytes:
     """Create iCal event from manually entered data."""
-    cal = icalendar.Calendar()
-    cal.add("prodid", "-//eluceo/ical//2.0/EN")
-    cal.add("version", "2.0")
-    cal.add("calscale", "GREGORIAN")
-    cal.add("method", "REQUEST")
-
-    event = icalendar.Event()
-    event.add(
-        "summary",
-        f"🛫 {data['airline_name']} {data['origin_airport_code']} ➡️ "
-        f"{data['destination_airport_code']} {data['flight_number']}",
-    )
-
-    origin_tz = timezone(data["origin_timezone"])
-    destination_tz = timezone(data["destination_timezone"])
+    origin_tz = _tz(data["origin_timezone"])
+    destination_tz = _tz(data["destination_timezone"])
 
     # Parse datetime format "YYYY-MM-DD HH:MM" to datetime
-    dtstart = origin_tz.localize(
-        datetime.strptime(data["scheduled_departure"], "%Y-%m-%d %H:%M")
+    dtstart = _localize(origin_tz, parse_manual_datetime(data["scheduled_departure"]))
+    dtend = _localize(destination_tz, parse_manual_datetime(data["scheduled_arrival"]))
+
+    return _build_ics(data, dtstart, dtend)
+
+
+def _build_ics(data: dict, dtstart: datetime, dtend: datetime) -> bytes:
+    """Render a single flight event in the same layout icalendar produces."""
+    summary = (
+        f"🛫 {data['airline_name']} {data['origin_airport_code']} ➡️ "
+        f"{data['destination_airport_code']} {data['flight_number']}"
     )
-    dtend = destination_tz.localize(
-        datetime.strptime(data["scheduled_arrival"], "%Y-%m-%d %H:%M")
+    description = (
+        f"{data['airline_name']} flight {data['flight_number']} / "
+        f"Departs {data['origin_airport']}, {data['origin_airport_code']}"
     )
+    return _ICS_TEMPLATE.format(
+        summary=_ics_text("SUMMARY", summary),
+        dtstart=_ics_datetime("DTSTART", dtstart),
+        dtend=_ics_datetime("DTEND", dtend),
+        dtstamp=f"{datetime.now(dt_timezone.utc):%Y%m%dT%H%M%S}",
+        description=_ics_text("DESCRIPTION", description),
+        location=_ics_text("LOCATION", str(data["origin_airport"])),
+    ).encode("utf-8")
+
+
+def _ics_text(name: str, value: str) -> str:
+    return foldline(f"{name}:{escape_char(value)}")
 
-    event.add("dtstart", dtstart)
-    event.add("dtend", dtend)
-    event.add("location", f"{data['origin_airport']}")
-    event.add(
-        "description",
-        f"{data['airline_name']} flight {data['flight_number']} / Departs {data['origin_airport']}, {data['origin_airport_code']}",
-    )
-    event.add("dtstamp", datetime.now(dt_timezone.utc))
-    event.add("status", "CONFIRMED")
 
-    cal.add_component(event)
-    ical_event = cal.to_ical()
-    return save_ical_event(ical_event)
+def _ics_datetime(name: str, dt: datetime) -> str:
+    value = f"{dt:%Y%m%dT%H%M%S}"
+    if dt.tzinfo.zone == "UTC":
+        return f"{name}:{value}Z"
+    return f"{name};TZID={dt.tzinfo.zone}:{value}"
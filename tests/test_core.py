@@ -1,19 +1,25 @@
 """Tests for core.py functions with mocked API calls."""
 
-import io
+from datetime import datetime
 
 import pandas as pd
 import pytest
+from pytz import UnknownTimeZoneError, utc
 
+import core
 from core import (
+    _FLIGHT_COLS,
     drop_ununique_flights,
     get_flight,
+    get_timezones_with_offsets,
     make_ical_event,
     make_ics_from_manual_data,
+    move_df_flight_dates,
     move_flight_date,
     parse_date,
     parse_flight_info,
     parse_flight_number,
+    parse_manual_datetime,
     parse_nice_datetime,
     update_df_timezones,
 )
@@ -46,6 +52,47 @@ MOCK_FLIGHT_DATA = {
 }
 
 
+class TestGetTimezonesWithOffsets:
+    """Test timezone list for the manual entry form."""
+
+    def test_get_timezones_with_offsets_sorted(self):
+        result = get_timezones_with_offsets()
+
+        def offset_minutes(display):
+            # "Name (UTC+05:30)" -> 330; hours are floored, minutes non-negative
+            hours, minutes = display.rsplit("(UTC", 1)[1].rstrip(")").split(":")
+            return int(hours) * 60 + int(minutes)
+
+        assert result
+        assert result == sorted(
+            result, key=lambda item: (offset_minutes(item[1]), item[0])
+        )
+
+    def test_get_timezones_with_offsets_cached(self):
+        assert get_timezones_with_offsets() is get_timezones_with_offsets()
+
+    def test_get_timezones_with_offsets_refreshes_stale_snapshot(self, mocker):
+        stale_time = datetime(2000, 1, 1, tzinfo=utc)
+        stale_timezones = []
+        mocker.patch("core._tz_snapshot", (stale_time, stale_timezones))
+
+        result = get_timezones_with_offsets()
+
+        assert core._tz_snapshot[0] > stale_time
+        assert result is not stale_timezones
+        assert result is core._tz_snapshot[1]
+        assert result
+
+    def test_get_timezones_with_offsets_keeps_fresh_snapshot(self, mocker):
+        fresh = (datetime.now(utc), [("UTC", "UTC (UTC+00:00)")])
+        mocker.patch("core._tz_snapshot", fresh)
+        compute = mocker.patch("core._compute_timezones_with_offsets")
+
+        assert get_timezones_with_offsets() is fresh[1]
+        assert core._tz_snapshot is fresh
+        compute.assert_not_called()
+
+
 class TestParseFlightNumber:
     """Test flight number parsing."""
 
@@ -76,11 +123,29 @@ class TestParseDate:
             parse_date("invalid-date")
 
 
+class TestParseManualDatetime:
+    """Test manual entry datetime parsing."""
+
+    def test_parse_manual_datetime_padded(self):
+        assert parse_manual_datetime("2024-10-23 14:30") == datetime(
+            2024, 10, 23, 14, 30
+        )
+
+    def test_parse_manual_datetime_unpadded(self):
+        assert parse_manual_datetime("2024-1-3 1:30") == datetime(2024, 1, 3, 1, 30)
+
+    def test_parse_manual_datetime_invalid_raises_error(self):
+        with pytest.raises(ValueError):
+            parse_manual_datetime("2024-10-23 14-30")
+        with pytest.raises(ValueError):
+            parse_manual_datetime("2024-13-23 14:30")
+
+
 class TestParseFlightInfo:
     """Test flight info parsing."""
 
     def test_parse_flight_info(self):
-        result = parse_flight_info([MOCK_FLIGHT_DATA], 0)
+        result = dict(zip(_FLIGHT_COLS, parse_flight_info([MOCK_FLIGHT_DATA], 0)))
 
         assert result["flight_number"] == "SQ327"
         assert result["airline_name"] == "Singapore Airlines"
@@ -93,6 +158,32 @@ class TestParseFlightInfo:
         assert result["scheduled_departure"] == "20241023 1430"
         assert result["scheduled_arrival"] == "20241024 0615"
 
+    def test_parse_flight_info_airline_from_code(self):
+        flight = {**MOCK_FLIGHT_DATA, "airline": None}
+        result = dict(zip(_FLIGHT_COLS, parse_flight_info([flight], 0)))
+
+        assert result["airline_name"] == "Singapore Airlines"
+
+    def test_parse_flight_info_unknown_airline_code(self):
+        flight = {
+            **MOCK_FLIGHT_DATA,
+            "identification": {"number": {"default": "XQ123"}},
+            "airline": None,
+        }
+        result = dict(zip(_FLIGHT_COLS, parse_flight_info([flight], 0)))
+
+        assert result["airline_name"] == "Airline (XQ)"
+
+    def test_parse_flight_info_no_airline_code(self):
+        flight = {
+            **MOCK_FLIGHT_DATA,
+            "identification": {"number": {"default": "123"}},
+            "airline": None,
+        }
+        result = dict(zip(_FLIGHT_COLS, parse_flight_info([flight], 0)))
+
+        assert result["airline_name"] == "Unknown Airline"
+
 
 class TestUpdateDfTimezones:
     """Test timezone conversion in DataFrame."""
@@ -118,6 +209,58 @@ class TestUpdateDfTimezones:
         # Verify format is maintained
         assert len(result.loc[0, "scheduled_departure"]) == 13  # "YYYYMMDD HHMM"
 
+    def test_update_df_timezones_multiple_zones(self):
+        df = pd.DataFrame(
+            [
+                {
+                    "scheduled_departure": "20241023 1430",
+                    "scheduled_arrival": "20241024 0615",
+                    "origin_timezone": "Asia/Singapore",
+                    "destination_timezone": "America/Los_Angeles",
+                },
+                {
+                    "scheduled_departure": "20240115 0000",
+                    "scheduled_arrival": "20240115 1200",
+                    "origin_timezone": "America/Los_Angeles",
+                    "destination_timezone": "Asia/Kolkata",
+                },
+                {
+                    "scheduled_departure": "20240701 1000",
+                    "scheduled_arrival": "20240701 2345",
+                    "origin_timezone": "Asia/Singapore",
+                    "destination_timezone": "America/Los_Angeles",
+                },
+            ]
+        )
+
+        result = update_df_timezones(df)
+
+        assert result["scheduled_departure"].tolist() == [
+            "20241023 2230",
+            "20240114 1600",
+            "20240701 1800",
+        ]
+        assert result["scheduled_arrival"].tolist() == [
+            "20241023 2315",
+            "20240115 1730",
+            "20240701 1645",
+        ]
+
+    def test_update_df_timezones_missing_timezone_raises_error(self):
+        df = pd.DataFrame(
+            [
+                {
+                    "scheduled_departure": "20241023 1430",
+                    "scheduled_arrival": "20241024 0615",
+                    "origin_timezone": None,
+                    "destination_timezone": "America/Los_Angeles",
+                }
+            ]
+        )
+
+        with pytest.raises(UnknownTimeZoneError):
+            update_df_timezones(df)
+
 
 class TestParseNiceDatetime:
     """Test nice datetime formatting."""
@@ -158,6 +301,17 @@ class TestDropUnuniqueFlights:
         result = drop_ununique_flights([flight1, flight2])
         assert len(result) == 1
 
+    def test_drop_ununique_flights_from_dict(self):
+        import copy
+
+        flight1 = copy.deepcopy(MOCK_FLIGHT_DATA)
+        flight2 = copy.deepcopy(MOCK_FLIGHT_DATA)
+        flight3 = copy.deepcopy(MOCK_FLIGHT_DATA)
+        flight2["time"]["scheduled"]["departure_time"] = "1630"
+
+        result = drop_ununique_flights({"a": flight1, "b": flight2, "c": flight3})
+        assert result == [flight1, flight2]
+
 
 class TestMoveFlightDate:
     """Test moving flight to different date."""
@@ -184,6 +338,53 @@ class TestMoveFlightDate:
         assert result["scheduled_departure"] == "20241025 1430"
         assert result["scheduled_arrival"] == "20241026 0615"
 
+    def test_move_flight_date_same_day_overnight(self):
+        flight_info = {
+            "scheduled_departure": "20241023 1430",
+            "scheduled_arrival": "20241024 0615",  # Next day arrival
+        }
+
+        result = move_flight_date(flight_info, "20241023")
+
+        assert result["scheduled_departure"] == "20241023 1430"
+        assert result["scheduled_arrival"] == "20241024 0615"
+
+    def test_move_df_flight_dates_same_day_overnight(self):
+        df = pd.DataFrame(
+            [
+                {
+                    "scheduled_departure": "20241023 1430",
+                    "scheduled_arrival": "20241024 0615",
+                }
+            ]
+        )
+
+        result = move_df_flight_dates(df, "20241023")
+
+        assert result.loc[0, "scheduled_departure"] == "20241023 1430"
+        assert result.loc[0, "scheduled_arrival"] == "20241024 0615"
+
+    def test_move_df_flight_dates(self):
+        df = pd.DataFrame(
+            [
+                {
+                    "scheduled_departure": "20241023 1430",
+                    "scheduled_arrival": "20241024 0615",
+                },
+                {
+                    "scheduled_departure": "20241020 2330",
+                    "scheduled_arrival": "20241020 2355",
+                },
+            ]
+        )
+
+        result = move_df_flight_dates(df, "20241025")
+
+        assert result.loc[0, "scheduled_departure"] == "20241025 1430"
+        assert result.loc[0, "scheduled_arrival"] == "20241026 0615"
+        assert result.loc[1, "scheduled_departure"] == "20241025 2330"
+        assert result.loc[1, "scheduled_arrival"] == "20241025 2355"
+
 
 class TestMakeIcalEvent:
     """Test iCal event creation."""
@@ -212,6 +413,62 @@ class TestMakeIcalEvent:
         assert b"SIN" in result
         assert b"SFO" in result
 
+    def test_make_ical_event_properties(self):
+        data = {
+            "flight_number": "SQ327",
+            "airline_name": "Singapore Airlines",
+            "origin_airport": "Singapore Changi Airport, Terminal 3",
+            "destination_airport": "San Francisco International Airport",
+            "origin_airport_code": "SIN",
+            "destination_airport_code": "SFO",
+            "scheduled_departure": "20241023 1430",
+            "scheduled_arrival": "20241024 0615",
+            "origin_timezone": "Asia/Singapore",
+            "destination_timezone": "UTC",
+        }
+
+        lines = make_ical_event(data).split(b"\r\n")
+
+        assert b"DTSTART;TZID=Asia/Singapore:20241023T143000" in lines
+        assert b"DTEND:20241024T061500Z" in lines
+        assert b"LOCATION:Singapore Changi Airport\\, Terminal 3" in lines
+        assert all(len(line) <= 75 for line in lines)
+
+    def test_make_ical_event_missing_airport_name(self):
+        data = {
+            "flight_number": "SQ327",
+            "airline_name": "Singapore Airlines",
+            "origin_airport": None,
+            "destination_airport": "San Francisco International Airport",
+            "origin_airport_code": "SIN",
+            "destination_airport_code": "SFO",
+            "scheduled_departure": "20241023 1430",
+            "scheduled_arrival": "20241024 0615",
+            "origin_timezone": "Asia/Singapore",
+            "destination_timezone": "America/Los_Angeles",
+        }
+
+        lines = make_ical_event(data).split(b"\r\n")
+
+        assert b"LOCATION:None" in lines
+
+    def test_make_ical_event_malformed_time_raises_error(self):
+        data = {
+            "flight_number": "SQ327",
+            "airline_name": "Singapore Airlines",
+            "origin_airport": "Singapore Changi Airport",
+            "destination_airport": "San Francisco International Airport",
+            "origin_airport_code": "SIN",
+            "destination_airport_code": "SFO",
+            "scheduled_departure": "2024 1023 1430",
+            "scheduled_arrival": "20241024T0615",
+            "origin_timezone": "Asia/Singapore",
+            "destination_timezone": "America/Los_Angeles",
+        }
+
+        with pytest.raises(ValueError):
+            make_ical_event(data)
+
 
 class TestMakeIcsFromManualData:
     """Test iCal creation from manual data."""
@@ -232,10 +489,28 @@ class TestMakeIcsFromManualData:
 
         result = make_ics_from_manual_data(data)
 
-        assert isinstance(result, io.BytesIO)
-        content = result.getvalue()
-        assert b"BEGIN:VCALENDAR" in content
-        assert b"UA123" in content
+        assert isinstance(result, bytes)
+        assert b"BEGIN:VCALENDAR" in result
+        assert b"UA123" in result
+
+    def test_make_ics_from_manual_data_unpadded_times(self):
+        data = {
+            "flight_number": "UA123",
+            "airline_name": "United Airlines",
+            "origin_airport": "San Francisco International Airport",
+            "destination_airport": "Los Angeles International Airport",
+            "origin_airport_code": "SFO",
+            "destination_airport_code": "LAX",
+            "scheduled_departure": "2024-10-23 9:05",
+            "scheduled_arrival": "2024-1-3 11:45",
+            "origin_timezone": "America/Los_Angeles",
+            "destination_timezone": "Etc/GMT+5",
+        }
+
+        lines = make_ics_from_manual_data(data).split(b"\r\n")
+
+        assert b"DTSTART;TZID=America/Los_Angeles:20241023T090500" in lines
+        assert b"DTEND;TZID=Etc/GMT+5:20240103T114500" in lines
 
 
 class TestGetFlight: